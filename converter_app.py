@@ -2,16 +2,322 @@
 
 from __future__ import annotations
 
+import contextlib
+import importlib.util
+import multiprocessing
+import multiprocessing.util
 import os
-import threading
+import queue
+import shutil
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from tkinter.scrolledtext import ScrolledText
-from typing import Iterable
+from typing import Callable, Iterable, Iterator
 import traceback
 
-import pythoncom
-import win32com.client
+# pywin32 is imported on first use by the worker processes; the GUI process never loads it.
+pythoncom = None
+win32com = None
+
+
+def _import_pywin32() -> None:
+    global pythoncom, win32com
+    import pythoncom
+    import win32com.client
+
+
+# Each pool worker process owns one dedicated Word instance, launched on first use and kept
+# for the life of the worker, which is the whole GUI session.
+_word_app = None
+_open_document = None
+_com_initialized = False
+
+# The Word-free .docx renderer relies on optional packages; without them every file goes through Word.
+# find_spec only proves they are installed: on Windows WeasyPrint also needs the Pango/GTK runtime,
+# so the real import is probed once when the option is first ticked.
+NATIVE_DOCX_AVAILABLE = all(importlib.util.find_spec(name) for name in ('mammoth', 'weasyprint'))
+_native_docx_error: str | None = None
+_native_docx_probed = False
+
+
+def _probe_native_docx() -> str | None:
+    """Import the native renderer once and return why it cannot be used, or None if it works."""
+    global _native_docx_error, _native_docx_probed
+    if not _native_docx_probed:
+        _native_docx_probed = True
+        try:
+            import mammoth  # noqa: F401
+            import weasyprint  # noqa: F401
+        except (ImportError, OSError) as exc:
+            _native_docx_error = str(exc)
+    return _native_docx_error
+
+# Optional pause after each document so Word can finish tearing it down; 0 disables it.
+# Raise to around 0.05 if Word starts rejecting calls ("Call was rejected by callee").
+WORD_SETTLE_DELAY_SECONDS = 0.0
+
+# Exports go to a uniquely named file next to the target and are renamed into place when complete.
+# The suffix still ends in ".pdf" so Word and WeasyPrint treat the file as a PDF.
+TEMP_PDF_SUFFIX = '.converting.pdf'
+
+# Extensions Word can open for conversion; anything else is rejected before a batch starts.
+WORD_EXTENSIONS = (".doc", ".docx", ".docm", ".rtf")
+
+# Paths added to the file list per Tk event-loop turn when loading large folders.
+LISTBOX_INSERT_CHUNK = 1000
+
+# Free space required in the output folder, as a multiple of the combined source size.
+DISK_SPACE_FACTOR = 1.5
+
+# Worker results are queued by executor callbacks; the Tk thread drains them on this cadence
+# and writes the log lines they produce to the widget in one insert per poll.
+UI_POLL_INTERVAL_MS = 50
+UI_MAX_MESSAGES_PER_POLL = 200
+
+# The log widget keeps only the most recent lines; the full batch log lives in memory for "Save Log".
+LOG_WIDGET_MAX_LINES = 2000
+LOG_WIDGET_TRIM_LINES = 500
+LOG_HISTORY_MAX_LINES = 100_000
+
+# Always spawn workers: each one must start with a clean COM state of its own.
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# Upper bound on worker processes, and therefore on hidden Word instances kept alive for the session.
+# Each Word holds hundreds of MB and throughput stops improving beyond two or three, so stay small.
+MAX_WORKERS = min(3, os.cpu_count() or 1)
+
+_WORD_TYPELIB_CLSID = '{00020905-0000-0000-C000-000000000046}'
+
+
+def _ensure_word_typelib() -> None:
+    """Generate the early-bound Word wrappers once, before several workers race to write them."""
+    _import_pywin32()
+    typelib = pythoncom.LoadRegTypeLib(_WORD_TYPELIB_CLSID, 8, 0, 0)
+    _, lcid, _, major, minor, _ = typelib.GetLibAttr()
+    win32com.client.gencache.EnsureModule(_WORD_TYPELIB_CLSID, lcid, major, minor)
+
+
+def _get_word_app():
+    global _word_app, _open_document, _com_initialized
+    if _word_app is not None:
+        try:
+            _word_app.Visible  # Cheap round-trip that fails if Word was closed or crashed.
+        except Exception:  # noqa: BLE001 - any COM failure means the instance is gone
+            _word_app = None
+            _open_document = None
+    if _word_app is None:
+        _import_pywin32()
+        if not _com_initialized:
+            # Word is only driven from this worker's main thread, which pumps messages between files.
+            pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+            _com_initialized = True
+            # Pool workers exit without running atexit hooks, so quit Word from a multiprocessing finalizer.
+            multiprocessing.util.Finalize(None, _quit_word_app, exitpriority=10)
+        # DispatchEx keeps a dedicated Word per worker; EnsureDispatch wraps it with early-bound methods.
+        word_app = win32com.client.gencache.EnsureDispatch(win32com.client.DispatchEx('Word.Application'))
+        word_app.Visible = False
+        # Keep Word from redrawing or prompting between documents.
+        word_app.ScreenUpdating = False
+        word_app.DisplayAlerts = win32com.client.constants.wdAlertsNone
+        _word_app = word_app
+        # Bound once per worker so each file skips the Documents/Open attribute lookups.
+        _open_document = word_app.Documents.Open
+    return _word_app
+
+
+def _quit_word_app() -> None:
+    global _word_app, _open_document, _com_initialized
+    try:
+        if _word_app is not None:
+            _word_app.ScreenUpdating = True
+            _word_app.Quit()
+    finally:
+        _word_app = None
+        _open_document = None
+        if _com_initialized:
+            _com_initialized = False
+            pythoncom.CoUninitialize()
+
+
+def _publish_pdf(tmp_path: str, pdf_path: str) -> None:
+    # os.replace is a single atomic rename (MoveFileEx with MOVEFILE_REPLACE_EXISTING on Windows),
+    # so a previous PDF stays intact until the new one is complete.
+    os.replace(tmp_path, pdf_path)
+
+
+def _make_temp_pdf(pdf_path: str) -> str:
+    # mkstemp gives each export its own file, so concurrent jobs never share a temp path.
+    prefix = os.path.splitext(os.path.basename(pdf_path))[0] + '.'
+    fd, tmp_path = tempfile.mkstemp(suffix=TEMP_PDF_SUFFIX, prefix=prefix, dir=os.path.dirname(pdf_path))
+    os.close(fd)
+    return tmp_path
+
+
+def _discard_temp_pdf(tmp_path: str) -> None:
+    # Best effort: a file something else still holds open raises PermissionError, which must not mask the real error.
+    with contextlib.suppress(OSError):
+        os.unlink(tmp_path)
+
+
+def _worker_convert(
+    doc_path_abs: str,
+    pdf_path_abs: str,
+    pdf_a: bool = False,
+    bookmarks: bool = False,
+    tagged: bool = False,
+    optimize_for_screen: bool = False,
+) -> str:
+    """Convert one document inside a pool worker and return the saved PDF path.
+
+    Both paths must already be absolute; they are resolved once per batch in the GUI process.
+    The export extras (PDF/A, heading bookmarks, structure tags) are off unless requested,
+    since generating them is a large share of Word's export time.
+    """
+    _get_word_app()
+    constants = win32com.client.constants
+    tmp_path = _make_temp_pdf(pdf_path_abs)
+    doc = None
+    published = False
+    try:
+        doc = _open_document(
+            FileName=doc_path_abs,
+            ReadOnly=True,
+            ConfirmConversions=False,
+            AddToRecentFiles=False,
+            Visible=False,
+        )
+        export = doc.ExportAsFixedFormat
+        export(
+            OutputFileName=tmp_path,
+            ExportFormat=constants.wdExportFormatPDF,
+            OpenAfterExport=False,
+            OptimizeFor=(
+                constants.wdExportOptimizeForOnScreen if optimize_for_screen else constants.wdExportOptimizeForPrint
+            ),
+            Range=constants.wdExportAllDocument,
+            Item=constants.wdExportDocumentContent,
+            IncludeDocProps=False,
+            KeepIRM=False,
+            CreateBookmarks=(
+                constants.wdExportCreateHeadingBookmarks if bookmarks else constants.wdExportCreateNoBookmarks
+            ),
+            DocStructureTags=tagged,
+            BitmapMissingFonts=True,
+            UseISO19005_1=pdf_a,
+        )
+        _publish_pdf(tmp_path, pdf_path_abs)
+        published = True
+    finally:
+        try:
+            if doc is not None:
+                doc.Close(SaveChanges=constants.wdDoNotSaveChanges)
+        finally:
+            # Word can hold the partial export open until the document is closed, so clean up only after.
+            if not published:
+                _discard_temp_pdf(tmp_path)
+            # An STA must pump its message queue or queued COM calls and callbacks stall.
+            pythoncom.PumpWaitingMessages()
+            if WORD_SETTLE_DELAY_SECONDS:
+                time.sleep(WORD_SETTLE_DELAY_SECONDS)
+
+    return pdf_path_abs
+
+
+def _convert_file_native(doc_path_abs: str, pdf_path_abs: str) -> str:
+    """Render a .docx to PDF with mammoth and WeasyPrint, falling back to Word if they cannot load."""
+    try:
+        import mammoth
+        import weasyprint
+    except OSError:
+        # WeasyPrint is installed but its Pango/GTK libraries are missing; Word can still do the job.
+        return _worker_convert(doc_path_abs, pdf_path_abs)
+
+    tmp_path = _make_temp_pdf(pdf_path_abs)
+    published = False
+    try:
+        with open(doc_path_abs, 'rb') as docx_file:
+            html = mammoth.convert_to_html(docx_file).value
+        weasyprint.HTML(string=html, base_url=os.path.dirname(doc_path_abs)).write_pdf(tmp_path)
+        _publish_pdf(tmp_path, pdf_path_abs)
+        published = True
+    finally:
+        if not published:
+            _discard_temp_pdf(tmp_path)
+
+    return pdf_path_abs
+
+
+def _is_pdf_current(doc_path_abs: str, pdf_path_abs: str) -> bool:
+    try:
+        return os.stat(pdf_path_abs).st_mtime >= os.stat(doc_path_abs).st_mtime
+    except OSError:
+        return False
+
+
+def _iter_word_files(directory: str) -> Iterator[str]:
+    """Yield Word documents under ``directory``, recursing without following directory symlinks."""
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_word_files(entry.path)
+                    continue
+            except OSError:
+                continue
+            name = entry.name.lower()
+            # Skip the "~$" owner files Word leaves next to open documents.
+            if name.endswith(WORD_EXTENSIONS) and not name.startswith("~$"):
+                yield entry.path
+
+
+def _build_output_path(file_path: str, output_dir: str) -> str:
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(output_dir, f"{base_name}.pdf")
+
+
+def _assign_output_paths(file_paths: list[str], output_dir: str) -> list[str]:
+    """Map each source to its own PDF path, numbering stems that would otherwise collide.
+
+    Sources sharing a stem (``report.doc`` and ``report.docx``, or one name in two folders)
+    become ``report.pdf``, ``report (2).pdf``, ... so parallel jobs never share a target.
+    """
+    natural = [_build_output_path(path, output_dir) for path in file_paths]
+    reserved = {os.path.normcase(path) for path in natural}
+    taken: set[str] = set()
+    assigned = []
+    for pdf_path in natural:
+        candidate = pdf_path
+        counter = 2
+        # A renamed output must also avoid another source's natural name.
+        while os.path.normcase(candidate) in taken or (
+            candidate != pdf_path and os.path.normcase(candidate) in reserved
+        ):
+            candidate = f"{os.path.splitext(pdf_path)[0]} ({counter}).pdf"
+            counter += 1
+        taken.add(os.path.normcase(candidate))
+        assigned.append(candidate)
+    return assigned
+
+
+class _ConversionBatch:
+    """Bookkeeping for the batch in flight; only touched on the Tk thread."""
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.jobs: list[tuple[str, Callable[..., str], tuple, dict]] = []
+        self.done = 0
+        self.success_count = 0
+        self.skipped_count = 0
+        self.failures: list[tuple[str, str]] = []
 
 
 class WordToPDFConverterApp:
@@ -20,16 +326,32 @@ class WordToPDFConverterApp:
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
         self.root.title("Word to PDF Converter")
-        self.root.geometry("600x480")
+        self.root.geometry("600x540")
         self.root.resizable(False, False)
 
         self.selected_files: list[str] = []
+        self._selected_set: set[str] = set()
+        self._listbox_pending: deque[str] = deque()
+        self._listbox_fill_job: str | None = None
         self.output_dir_var = tk.StringVar()
         self.progress_var = tk.DoubleVar(value=0.0)
         self.status_var = tk.StringVar(value="Select Word files to begin.")
-        self._conversion_thread: threading.Thread | None = None
+        self.native_docx_var = tk.BooleanVar(value=False)
+        self.skip_current_var = tk.BooleanVar(value=False)
+        self.pdf_a_var = tk.BooleanVar(value=False)
+        self.bookmarks_var = tk.BooleanVar(value=False)
+        self.tagged_pdf_var = tk.BooleanVar(value=False)
+        self.screen_optimized_var = tk.BooleanVar(value=False)
+        self._batch: _ConversionBatch | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._typelib_ready = False
+        self._ui_queue: queue.Queue[tuple[str, tuple]] = queue.Queue()
+        self._pending_log: list[str] = []
+        self._log_history: deque[str] = deque(maxlen=LOG_HISTORY_MAX_LINES)
 
         self._build_widgets()
+        self.root.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _build_widgets(self) -> None:
         padding = {"padx": 10, "pady": 5}
@@ -40,12 +362,18 @@ class WordToPDFConverterApp:
         add_button = tk.Button(button_frame, text="Add Word Files", command=self.add_files)
         add_button.pack(side=tk.LEFT)
 
+        add_folder_button = tk.Button(button_frame, text="Add Folder", command=self.add_folder)
+        add_folder_button.pack(side=tk.LEFT, padx=(10, 0))
+
         convert_button = tk.Button(button_frame, text="Start Conversion", command=self.start_conversion)
         convert_button.pack(side=tk.LEFT, padx=(10, 0))
 
         clear_button = tk.Button(button_frame, text="Clear List", command=self.clear_file_list)
         clear_button.pack(side=tk.LEFT, padx=(10, 0))
 
+        save_log_button = tk.Button(button_frame, text="Save Log", command=self.save_log)
+        save_log_button.pack(side=tk.RIGHT)
+
         file_frame = tk.LabelFrame(self.root, text="Selected Files")
         file_frame.pack(fill=tk.BOTH, expand=True, **padding)
 
@@ -64,6 +392,36 @@ class WordToPDFConverterApp:
         browse_button = tk.Button(output_frame, text="Browse", command=self.choose_output_directory)
         browse_button.pack(side=tk.LEFT)
 
+        options_frame = tk.Frame(self.root)
+        options_frame.pack(fill=tk.X, **padding)
+
+        native_text = "Render .docx without Word (faster, lower fidelity)"
+        if not NATIVE_DOCX_AVAILABLE:
+            native_text = "Render .docx without Word (needs mammoth, weasyprint + Pango)"
+        native_check = tk.Checkbutton(
+            options_frame, text=native_text, variable=self.native_docx_var, command=self._on_native_toggled
+        )
+        native_check.pack(side=tk.LEFT)
+        if not NATIVE_DOCX_AVAILABLE:
+            native_check.config(state=tk.DISABLED)
+
+        skip_check = tk.Checkbutton(options_frame, text="Skip up-to-date", variable=self.skip_current_var)
+        skip_check.pack(side=tk.LEFT, padx=(10, 0))
+
+        export_frame = tk.Frame(self.root)
+        export_frame.pack(fill=tk.X, **padding)
+
+        export_checks = []
+        for text, variable in (
+            ("PDF/A", self.pdf_a_var),
+            ("Heading bookmarks", self.bookmarks_var),
+            ("Tagged PDF", self.tagged_pdf_var),
+            ("Optimize for screen", self.screen_optimized_var),
+        ):
+            check = tk.Checkbutton(export_frame, text=text, variable=variable)
+            check.pack(side=tk.LEFT, padx=(0, 10))
+            export_checks.append(check)
+
         progress_frame = tk.Frame(self.root)
         progress_frame.pack(fill=tk.X, **padding)
 
@@ -81,19 +439,43 @@ class WordToPDFConverterApp:
 
         self.convert_button = convert_button
         self.add_button = add_button
+        self.add_folder_button = add_folder_button
         self.clear_button = clear_button
         self.browse_button = browse_button
+        self.native_check = native_check
+        self.export_checks = export_checks
+        self.skip_check = skip_check
 
     def add_files(self) -> None:
-        filetypes = [("Word documents", "*.doc;*.docx"), ("All files", "*.*")]
+        filetypes = [("Word documents", ";".join(f"*{ext}" for ext in WORD_EXTENSIONS)), ("All files", "*.*")]
         new_files = filedialog.askopenfilenames(title="Select Word files", filetypes=filetypes)
-        added = 0
-        for path in new_files:
-            normalized = os.path.normpath(path)
-            if normalized not in self.selected_files:
-                self.selected_files.append(normalized)
-                self.file_listbox.insert(tk.END, normalized)
-                added += 1
+        self._add_paths(new_files)
+
+    def add_folder(self) -> None:
+        directory = filedialog.askdirectory(title="Select folder with Word files")
+        if not directory:
+            return
+        self._set_status("Scanning folder...")
+        self.root.update_idletasks()
+        found = list(_iter_word_files(os.path.normpath(directory)))
+        if not found:
+            self._set_status("No Word files found in the selected folder.")
+            return
+        self._add_paths(found)
+
+    def _add_paths(self, new_files: Iterable[str]) -> None:
+        new_files = list(new_files)
+        # dict.fromkeys drops repeats within the selection while keeping the dialog's order.
+        to_add = [
+            path
+            for path in dict.fromkeys(os.path.normpath(p) for p in new_files)
+            if path not in self._selected_set
+        ]
+        if to_add:
+            self._selected_set.update(to_add)
+            self.selected_files.extend(to_add)
+            self._insert_listbox_chunks(to_add)
+        added = len(to_add)
 
         if self.selected_files and not self.output_dir_var.get():
             self.output_dir_var.set(os.path.dirname(self.selected_files[0]))
@@ -103,12 +485,65 @@ class WordToPDFConverterApp:
         elif new_files:
             self._set_status("No new files added (duplicates skipped).")
 
+    def _insert_listbox_chunks(self, paths: list[str]) -> None:
+        # Paths join one pending queue so adds made while a fill is running keep selected_files order.
+        self._listbox_pending.extend(paths)
+        if self._listbox_fill_job is None:
+            self._fill_listbox_chunk()
+
+    def _fill_listbox_chunk(self) -> None:
+        # Large folders are inserted a chunk per event-loop turn so the window keeps repainting.
+        pending = self._listbox_pending
+        chunk = [pending.popleft() for _ in range(min(LISTBOX_INSERT_CHUNK, len(pending)))]
+        self.file_listbox.insert(tk.END, *chunk)
+        if pending:
+            self._listbox_fill_job = self.root.after(1, self._fill_listbox_chunk)
+        else:
+            self._listbox_fill_job = None
+
+    def _cancel_listbox_fill(self) -> None:
+        self._listbox_pending.clear()
+        if self._listbox_fill_job is not None:
+            self.root.after_cancel(self._listbox_fill_job)
+            self._listbox_fill_job = None
+
     def clear_file_list(self) -> None:
+        self._cancel_listbox_fill()
         self.selected_files.clear()
+        self._selected_set.clear()
         self.file_listbox.delete(0, tk.END)
         self.progress_var.set(0.0)
         self._set_status("Cleared file list.")
 
+    def _remove_files(self, paths: Iterable[str]) -> None:
+        removed = set(paths)
+        self.selected_files = [path for path in self.selected_files if path not in removed]
+        self._selected_set.difference_update(removed)
+        self._cancel_listbox_fill()
+        self.file_listbox.delete(0, tk.END)
+        if self.selected_files:
+            self._insert_listbox_chunks(self.selected_files)
+        self._set_status(f"Removed {len(removed)} invalid file(s). Total: {len(self.selected_files)}")
+
+    def save_log(self) -> None:
+        if not self._log_history:
+            self._set_status("Log is empty; nothing to save.")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Save log",
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as log_file:
+                log_file.write("\n".join(self._log_history) + "\n")
+        except OSError as exc:
+            messagebox.showerror("Save failed", f"Could not save the log: {exc}")
+            return
+        self._set_status(f"Log saved to: {os.path.normpath(path)}")
+
     def choose_output_directory(self) -> None:
         directory = filedialog.askdirectory(title="Select output folder")
         if directory:
@@ -116,7 +551,7 @@ class WordToPDFConverterApp:
             self._set_status(f"Output folder set to: {self.output_dir_var.get()}")
 
     def start_conversion(self) -> None:
-        if self._conversion_thread and self._conversion_thread.is_alive():
+        if self._batch is not None:
             messagebox.showinfo("Conversion in progress", "Please wait for the current batch to finish.")
             return
 
@@ -133,11 +568,74 @@ class WordToPDFConverterApp:
             messagebox.showerror("Invalid folder", "The selected output folder does not exist.")
             return
 
-        self._prepare_for_conversion()
+        # Validate on the GUI thread so an unusable batch never pays for starting Word.
+        invalid = []
+        sizes: dict[str, int] = {}
+        for path in self.selected_files:
+            if not os.path.isfile(path) or os.path.splitext(path)[1].lower() not in WORD_EXTENSIONS:
+                invalid.append(path)
+                continue
+            try:
+                # A file deleted since the isfile check is treated like any other missing file.
+                sizes[path] = os.path.getsize(path)
+            except OSError:
+                invalid.append(path)
+        if invalid:
+            listing = "\n".join(f"- {path}" for path in invalid[:20])
+            if len(invalid) > 20:
+                listing += f"\n... and {len(invalid) - 20} more"
+            drop = messagebox.askyesno(
+                "Invalid files",
+                f"{len(invalid)} file(s) are missing or are not Word documents:\n\n{listing}\n\n"
+                "Remove them from the list and continue?",
+            )
+            if not drop:
+                return
+            self._remove_files(invalid)
+            if not self.selected_files:
+                messagebox.showwarning("No files selected", "No valid Word documents are left to convert.")
+                return
 
         files = tuple(self.selected_files)
-        self._conversion_thread = threading.Thread(target=self._run_conversion, args=(files, output_dir), daemon=True)
-        self._conversion_thread.start()
+        skip_current = self.skip_current_var.get()
+
+        # Only files that will actually be exported count towards the space estimate.
+        to_convert = files
+        if skip_current:
+            output_dir_abs = os.path.abspath(output_dir)
+            pdf_paths = _assign_output_paths(list(files), output_dir_abs)
+            to_convert = [
+                path
+                for path, pdf_path_abs in zip(files, pdf_paths)
+                if not _is_pdf_current(os.path.abspath(path), pdf_path_abs)
+            ]
+        required = sum(sizes[path] for path in to_convert) * DISK_SPACE_FACTOR
+        space_warning = None
+        try:
+            free = shutil.disk_usage(output_dir).free
+        except OSError as exc:
+            # Some network shares cannot report free space; convert anyway rather than refuse.
+            space_warning = f'[WARN] Could not check free space in {output_dir}: {exc}'
+            free = None
+        if free is not None and free < required:
+            messagebox.showerror(
+                "Not enough disk space",
+                f"The output folder has {free / 2**20:.1f} MB free, but about {required / 2**20:.1f} MB is needed.",
+            )
+            return
+
+        self._prepare_for_conversion()
+        if space_warning:
+            self._queue_log(space_warning)
+
+        use_native = self.native_docx_var.get()
+        export_options = {
+            "pdf_a": self.pdf_a_var.get(),
+            "bookmarks": self.bookmarks_var.get(),
+            "tagged": self.tagged_pdf_var.get(),
+            "optimize_for_screen": self.screen_optimized_var.get(),
+        }
+        self._start_batch(files, output_dir, use_native, export_options, skip_current)
 
     def _prepare_for_conversion(self) -> None:
         self.progress_var.set(0.0)
@@ -145,110 +643,237 @@ class WordToPDFConverterApp:
         self._set_status("Starting conversion...")
         self._toggle_controls(state=tk.DISABLED)
 
-    def _run_conversion(self, files: Iterable[str], output_dir: str) -> None:
-        com_initialized = False
-        word_app = None
-        try:
-            pythoncom.CoInitialize()
-            com_initialized = True
-            self._log_from_thread('Launching Microsoft Word...')
-            word_app = win32com.client.DispatchEx('Word.Application')
-            word_app.Visible = False
-
-            files_list = list(files)
-            total = len(files_list)
-            if total == 0:
-                self._log_from_thread('No files to convert.')
-                self.root.after(0, self._set_status, 'No files to convert.')
-                return
+    def _start_batch(
+        self,
+        files: Iterable[str],
+        output_dir: str,
+        use_native: bool,
+        export_options: dict[str, bool],
+        skip_current: bool,
+    ) -> None:
+        files_list = list(files)
+        batch = _ConversionBatch(total=len(files_list))
+        self._batch = batch
+        if batch.total == 0:
+            self._queue_log('No files to convert.')
+            self._set_status('No files to convert.')
+            self._finish_batch()
+            return
+
+        output_dir_abs = os.path.abspath(output_dir)
+        pdf_paths = _assign_output_paths(files_list, output_dir_abs)
+        for file_path, pdf_path_abs in zip(files_list, pdf_paths):
+            doc_path_abs = os.path.abspath(file_path)
+            if pdf_path_abs != _build_output_path(file_path, output_dir_abs):
+                self._queue_log(f'[RENAME] {file_path} -> {os.path.basename(pdf_path_abs)} (name already used)')
+            if skip_current and _is_pdf_current(doc_path_abs, pdf_path_abs):
+                batch.skipped_count += 1
+                self._queue_log(f'[SKIP] Up to date: {pdf_path_abs}')
+                continue
+            if use_native and os.path.splitext(file_path)[1].lower() == '.docx':
+                job = (file_path, _convert_file_native, (doc_path_abs, pdf_path_abs), {})
+            else:
+                job = (file_path, _worker_convert, (doc_path_abs, pdf_path_abs), export_options)
+            batch.jobs.append(job)
+
+        native_jobs = sum(1 for _, convert, _, _ in batch.jobs if convert is _convert_file_native)
+        if native_jobs and any(export_options.values()):
+            self._queue_log(
+                f'[WARN] {native_jobs} .docx file(s) are rendered without Word; '
+                'PDF/A, bookmarks, tagged PDF and screen optimization are not applied to them.'
+            )
+
+        batch.done = batch.skipped_count
+        if batch.skipped_count:
+            self.progress_var.set((batch.done / batch.total) * 100.0)
+        if not batch.jobs:
+            self._finish_batch()
+            return
 
-            self._log_from_thread(f'Converting {total} file(s)...')
-            success_count = 0
-            failures: list[tuple[str, str]] = []
+        max_workers = min(MAX_WORKERS, len(batch.jobs))
+        self._queue_log(f'Converting {len(batch.jobs)} file(s) with up to {max_workers} worker(s)...')
 
-            for index, file_path in enumerate(files_list, start=1):
-                self._log_from_thread(f'Converting: {file_path}')
-                try:
-                    pdf_path = self._build_output_path(file_path, output_dir)
-                    saved_path = self._convert_file(word_app, file_path, pdf_path)
-                    success_count += 1
-                    self._log_from_thread(f'[OK] Saved: {saved_path}')
-                except Exception as exc:  # noqa: BLE001 - surface conversion issues
-                    error_message = str(exc)
-                    failures.append((file_path, error_message))
-                    self._log_from_thread(f'[ERROR] Failed: {file_path} -> {error_message}')
-                finally:
-                    progress = (index / total) * 100.0
-                    self.root.after(0, self.progress_var.set, progress)
-
-            summary_message = f'Converted {success_count} of {total} file(s).'
-            if failures:
-                summary_message += ' Check log for details.'
-            self._log_from_thread(summary_message)
-            self.root.after(0, self._set_status, summary_message)
+        if not self._typelib_ready and any(convert is _worker_convert for _, convert, _, _ in batch.jobs):
+            # Run the one-off typelib codegen in a single worker before the first batch fans out.
+            try:
+                future = self._submit(_ensure_word_typelib)
+            except Exception as exc:  # noqa: BLE001 - unexpected failure
+                self._abort_batch(exc)
+                return
+            future.add_done_callback(lambda done: self._ui_queue.put(('typelib', (batch, done))))
+        else:
+            self._submit_jobs()
 
-            if failures:
-                details = '\n'.join(f'- {os.path.basename(path)}: {reason}' for path, reason in failures)
-                message = 'Some files could not be converted.\n\n' + details
-                self.root.after(0, messagebox.showwarning, 'Conversion completed with errors', message)
-            else:
-                self.root.after(0, messagebox.showinfo, 'Conversion complete', summary_message)
+    def _submit_jobs(self) -> None:
+        batch = self._batch
+        try:
+            for file_path, convert, args, kwargs in batch.jobs:
+                self._queue_log(f'Queued: {file_path}')
+                future = self._submit(convert, *args, **kwargs)
+                # Done callbacks run on the executor's manager thread, so they only enqueue the result.
+                future.add_done_callback(
+                    lambda done, path=file_path: self._ui_queue.put(('result', (batch, path, done)))
+                )
         except Exception as exc:  # noqa: BLE001 - unexpected failure
-            self._log_thread_error('Unexpected error during conversion', exc)
-        finally:
-            if word_app is not None:
-                word_app.Quit()
-            if com_initialized:
-                pythoncom.CoUninitialize()
-            self.root.after(0, self._toggle_controls, tk.NORMAL)
+            self._abort_batch(exc)
 
-    def _log_thread_error(self, prefix: str, exc: Exception) -> None:
-        message = f"{prefix}: {exc}"
-        self._log_from_thread(message)
-        trace = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__)).strip()
-        if trace:
-            for line in trace.splitlines():
-                self._log_from_thread(line)
-        self.root.after(0, self._set_status, message)
-        self.root.after(0, messagebox.showerror, "Conversion error", message)
-
-    def _convert_file(self, word_app, doc_path: str, pdf_path: str) -> str:
-        wd_format_pdf = 17  # Word WdExportFormat constant
-        doc_path_abs = os.path.abspath(doc_path)
-        pdf_path_abs = os.path.abspath(pdf_path)
-
-        if os.path.exists(pdf_path_abs):
-            os.remove(pdf_path_abs)
-
-        doc = None
+    def _abort_batch(self, exc: Exception) -> None:
+        self._discard_executor()
+        self._finish_batch(summarize=False)
+        self._report_error('Unexpected error during conversion', exc)
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        # Workers spawn on demand and keep their Word instance alive between batches.
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=_MP_CONTEXT)
+        return self._executor
+
+    def _submit(self, func: Callable[..., object], *args, **kwargs) -> Future:
         try:
-            doc = word_app.Documents.Open(doc_path_abs, ReadOnly=True)
-            doc.ExportAsFixedFormat(pdf_path_abs, wd_format_pdf)
-        finally:
-            if doc is not None:
-                doc.Close(False)
+            return self._ensure_executor().submit(func, *args, **kwargs)
+        except BrokenProcessPool:
+            # The session pool can break while idle (a worker or its Word was killed); retry once on a fresh one.
+            self._discard_executor()
+            return self._ensure_executor().submit(func, *args, **kwargs)
+
+    def _discard_executor(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _on_close(self) -> None:
+        # Pending files are dropped; workers finish their current file, then quit Word on exit.
+        self._batch = None
+        self._discard_executor()
+        self.root.destroy()
+
+    def _on_typelib_ready(self, batch: _ConversionBatch, future: Future) -> None:
+        if batch is not self._batch:
+            return
+        exc = future.exception()
+        if exc is not None:
+            if isinstance(exc, BrokenProcessPool):
+                self._discard_executor()
+            self._finish_batch(summarize=False)
+            self._report_error('Unexpected error during conversion', exc)
+            return
+        self._typelib_ready = True
+        self._submit_jobs()
 
-        return pdf_path_abs
+    def _on_file_done(self, batch: _ConversionBatch, file_path: str, future: Future) -> None:
+        # Results can still trickle in from a batch that was already abandoned.
+        if batch is not self._batch:
+            return
+        try:
+            saved_path = future.result()
+            batch.success_count += 1
+            self._queue_log(f'[OK] Saved: {saved_path}')
+        except Exception as exc:  # noqa: BLE001 - surface conversion issues
+            if isinstance(exc, BrokenProcessPool):
+                # A worker died; start a fresh pool for the next batch.
+                self._discard_executor()
+            error_message = str(exc)
+            batch.failures.append((file_path, error_message))
+            self._queue_log(f'[ERROR] Failed: {file_path} -> {error_message}')
+        batch.done += 1
+        self.progress_var.set((batch.done / batch.total) * 100.0)
+        if batch.done == batch.total:
+            self._finish_batch()
+
+    def _finish_batch(self, summarize: bool = True) -> None:
+        batch = self._batch
+        self._batch = None
+
+        if summarize and batch.total:
+            summary_message = f'Converted {batch.success_count} of {batch.total} file(s).'
+            if batch.skipped_count:
+                summary_message += f' Skipped {batch.skipped_count} up-to-date file(s).'
+            if batch.failures:
+                summary_message += ' Check log for details.'
+            self._queue_log(summary_message)
+            self._set_status(summary_message)
+        # Show the full log before any dialog blocks the event loop.
+        self._flush_log()
+        self._toggle_controls(tk.NORMAL)
+
+        if summarize and batch.total:
+            if batch.failures:
+                details = '\n'.join(f'- {os.path.basename(path)}: {reason}' for path, reason in batch.failures)
+                message = 'Some files could not be converted.\n\n' + details
+                messagebox.showwarning('Conversion completed with errors', message)
+            else:
+                messagebox.showinfo('Conversion complete', summary_message)
 
-    def _build_output_path(self, file_path: str, output_dir: str) -> str:
-        base_name = os.path.splitext(os.path.basename(file_path))[0]
-        return os.path.join(output_dir, f"{base_name}.pdf")
+    def _report_error(self, prefix: str, exc: Exception) -> None:
+        # Callers end the batch first, so results arriving while the dialog is open are ignored.
+        message = f"{prefix}: {exc}"
+        self._queue_log(message)
+        # format() yields the traceback piece by piece; the pending log lands in the widget in one insert.
+        for chunk in traceback.TracebackException.from_exception(exc).format():
+            self._queue_log(chunk.rstrip())
+        self._flush_log()
+        self._set_status(message)
+        messagebox.showerror("Conversion error", message)
+
+    def _on_native_toggled(self) -> None:
+        if not self.native_docx_var.get():
+            return
+        error = _probe_native_docx()
+        if error is None:
+            return
+        self.native_docx_var.set(False)
+        self.native_check.config(
+            state=tk.DISABLED, text="Render .docx without Word (WeasyPrint cannot load; install Pango)"
+        )
+        self._set_status(f"Native .docx rendering unavailable: {error}")
 
     def _toggle_controls(self, state: str) -> None:
-        for widget in (self.convert_button, self.add_button, self.clear_button, self.browse_button):
+        controls = (self.convert_button, self.add_button, self.add_folder_button, self.clear_button, self.browse_button)
+        for widget in (*controls, self.skip_check, *self.export_checks):
             widget.config(state=state)
+        if NATIVE_DOCX_AVAILABLE and _native_docx_error is None:
+            self.native_check.config(state=state)
 
     def _clear_log(self) -> None:
         self.log_widget.config(state=tk.NORMAL)
         self.log_widget.delete("1.0", tk.END)
         self.log_widget.config(state=tk.DISABLED)
+        self._log_history.clear()
+        self._pending_log.clear()
+
+    def _queue_log(self, message: str) -> None:
+        self._pending_log.append(message)
 
-    def _log_from_thread(self, message: str) -> None:
-        self.root.after(0, self._append_log, message)
+    def _flush_log(self) -> None:
+        if not self._pending_log:
+            return
+        self._log_history.extend(self._pending_log)
+        self._append_log("\n".join(self._pending_log))
+        self._pending_log.clear()
+
+    def _drain_ui_queue(self) -> None:
+        try:
+            for _ in range(UI_MAX_MESSAGES_PER_POLL):
+                try:
+                    kind, value = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "typelib":
+                    self._on_typelib_ready(*value)
+                elif kind == "result":
+                    self._on_file_done(*value)
+            self._flush_log()
+        finally:
+            self.root.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
 
     def _append_log(self, message: str) -> None:
         self.log_widget.config(state=tk.NORMAL)
         self.log_widget.insert(tk.END, message + "\n")
+        line_count = int(self.log_widget.index("end-1c").split(".")[0])
+        excess = line_count - LOG_WIDGET_MAX_LINES
+        if excess > 0:
+            # Trim in chunks so the widget is not re-laid out on every append once it is full.
+            self.log_widget.delete("1.0", f"{excess + LOG_WIDGET_TRIM_LINES + 1}.0")
         self.log_widget.see(tk.END)
         self.log_widget.config(state=tk.DISABLED)
 
@@ -263,6 +888,7 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
 
 